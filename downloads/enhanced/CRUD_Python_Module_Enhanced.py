@@ -7,19 +7,36 @@ layer around a MongoDB collection using the CRUD pattern.
 
 Milestone Four database-focused enhancements include:
 - Optional use of environment variables for MongoDB credentials
-- Cleaning MongoDB result documents to remove internal _id fields
+- Excluding internal _id fields from results via server-side projection
 - Clearer documentation of database behaviors and failure modes
+- An asyncio-based AsyncAnimalShelter (Motor) for concurrent, I/O-bound callers
 """
 
 from __future__ import annotations
 
 import os
-from typing import Any, Dict, List, Optional, Tuple
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple, Union
 import logging
 
+from bson import json_util
+from bson.codec_options import CodecOptions
+from bson.raw_bson import RawBSONDocument
+
 from pymongo import MongoClient
 from pymongo.collection import Collection
-from pymongo.errors import PyMongoError, ServerSelectionTimeoutError
+from pymongo.cursor import Cursor
+from pymongo.errors import BulkWriteError, PyMongoError, ServerSelectionTimeoutError
+from pymongo.results import BulkWriteResult
+from pymongo.write_concern import WriteConcern
+
+try:
+    from motor.motor_asyncio import AsyncIOMotorClient
+except ImportError:  # Motor is only required for AsyncAnimalShelter
+    AsyncIOMotorClient = None  # type: ignore[assignment,misc]
 
 
 # ----------------------------------------------------------------------
@@ -36,6 +53,143 @@ if not logger.handlers:
     logger.addHandler(handler)
     logger.setLevel(logging.INFO)
 
+# Maximum number of documents sent per insert_many() call in create_many()
+_BULK_CHUNK_SIZE = 1000
+
+# Default number of documents the server returns per cursor batch
+_READ_BATCH_SIZE = 1000
+
+# Shared query/projection documents, reused instead of allocating a new dict
+# on every read. They are passed to the driver only and must never be mutated.
+_EMPTY_QUERY: Dict[str, Any] = {}
+_PROJ_NO_ID: Dict[str, int] = {"_id": 0}
+
+# Maximum number of distinct read() results kept by the query cache
+_QUERY_CACHE_SIZE = 256
+
+# MongoClient instances shared by AnimalShelter objects with the same
+# connection settings, with a count of the shelters using each one
+_CLIENT_CACHE: Dict[tuple, MongoClient] = {}
+_CLIENT_REFCOUNTS: Dict[tuple, int] = {}
+_CLIENT_LOCK = threading.Lock()
+
+# Indexes for the query shapes used by the dashboard, as (keys, options)
+# pairs for AnimalShelter.ensure_indexes(). Equality fields come first and
+# range fields last, so a single index seek serves each filter. Queries on a
+# leading prefix of an index's keys are served by that index, so no separate
+# prefix indexes are needed. Once built, they can be named in
+# read(hint=...) to skip query plan selection:
+#   rescue filter (animal_type, breed $in, sex, age range) -> "rescue_filter"
+#   {"animal_type": ...} or {"animal_type": ..., "breed": ...}
+#                                                          -> "rescue_filter"
+#   {"outcome_type": ...} sorted by datetime               -> "outcome_date"
+SUGGESTED_INDEXES: List[Tuple[List[Tuple[str, int]], Dict[str, Any]]] = [
+    (
+        [
+            ("animal_type", 1),
+            ("breed", 1),
+            ("sex_upon_outcome", 1),
+            ("age_upon_outcome_in_weeks", 1),
+        ],
+        {"name": "rescue_filter"},
+    ),
+    ([("outcome_type", 1), ("datetime", 1)], {"name": "outcome_date"}),
+]
+
+# Canned rollup for AnimalShelter.refresh_rollup(): outcome counts per
+# outcome_type per calendar month ("YYYY-MM", from the 'datetime' field).
+# Documents whose 'datetime' cannot be parsed are grouped under month None.
+OUTCOME_BY_MONTH_PIPELINE: List[Dict[str, Any]] = [
+    {
+        "$project": {
+            "_id": 0,
+            "outcome_type": 1,
+            "month": {
+                "$dateToString": {
+                    "format": "%Y-%m",
+                    "date": {
+                        "$convert": {
+                            "input": "$datetime",
+                            "to": "date",
+                            "onError": None,
+                            "onNull": None,
+                        }
+                    },
+                }
+            },
+        }
+    },
+    {
+        "$group": {
+            "_id": {"outcome_type": "$outcome_type", "month": "$month"},
+            "count": {"$sum": 1},
+        }
+    },
+    {
+        "$project": {
+            "outcome_type": "$_id.outcome_type",
+            "month": "$_id.month",
+            "count": 1,
+        }
+    },
+]
+
+
+def build_query(
+    equalities: Optional[Dict[str, Any]] = None,
+    any_of: Optional[Dict[str, List[Any]]] = None,
+    ranges: Optional[Dict[str, Tuple[Any, Any]]] = None,
+) -> Dict[str, Any]:
+    """Build an index-friendly MongoDB query document.
+
+    Prefer this over `$regex` alternations such as
+    `{"breed": {"$regex": "Labrador|Poodle"}}`: a regex must be evaluated
+    against every document, while `$in` and range conditions can be
+    answered from an index (see SUGGESTED_INDEXES).
+
+    Parameters
+    ----------
+    equalities : dict, optional
+        field -> value pairs that must match exactly.
+    any_of : dict, optional
+        field -> list of accepted values, emitted as `$in`.
+    ranges : dict, optional
+        field -> (low, high) inclusive bounds, emitted as `$gte`/`$lte`.
+        Either bound may be None to leave that side open.
+
+    A field may appear in both `any_of` and `ranges`; the conditions are
+    combined. A field in `equalities` may not appear anywhere else.
+
+        build_query(
+            equalities={"animal_type": "Dog"},
+            any_of={"breed": ["Labrador Retriever Mix", "Newfoundland"]},
+            ranges={"age_upon_outcome_in_weeks": (26, 156)},
+        )
+        # {"animal_type": "Dog",
+        #  "breed": {"$in": ["Labrador Retriever Mix", "Newfoundland"]},
+        #  "age_upon_outcome_in_weeks": {"$gte": 26, "$lte": 156}}
+    """
+    equalities = equalities or {}
+    query: Dict[str, Any] = dict(equalities)
+
+    for field, values in (any_of or {}).items():
+        if field in equalities:
+            raise ValueError(f"build_query() got conflicting conditions for '{field}'")
+        query[field] = {"$in": list(values)}
+
+    for field, (low, high) in (ranges or {}).items():
+        if field in equalities:
+            raise ValueError(f"build_query() got conflicting conditions for '{field}'")
+        if low is None and high is None:
+            continue
+        condition = query.setdefault(field, {})
+        if low is not None:
+            condition["$gte"] = low
+        if high is not None:
+            condition["$lte"] = high
+
+    return query
+
 
 class AnimalShelter:
     """Data access object (DAO) for the AAC 'animals' collection.
@@ -61,6 +215,27 @@ class AnimalShelter:
         Name of the collection containing animal records (e.g., "animals").
     authSource : str, optional
         Authentication database; defaults to "admin".
+    maxPoolSize : int, optional
+        Maximum number of pooled connections; defaults to 100.
+    minPoolSize : int, optional
+        Number of connections kept open while idle; defaults to 10.
+    maxIdleTimeMS : int, optional
+        Milliseconds a pooled connection may sit idle before it is closed.
+    direct : bool, optional
+        If True (default), connect directly to the single server at
+        host:port instead of running replica-set topology discovery, and
+        poll it less often. Must be False for replica sets and sharded
+        clusters.
+    trusted : bool, optional
+        If True, create() and read() are replaced with specialized versions
+        that skip argument validation and per-call logging, for hot loops
+        whose inputs are known to be well formed. The validating versions
+        stay available as create_checked() and read_checked().
+
+    Shelters created with the same host, port, credentials, authSource and
+    direct setting share one MongoClient and its connection pool, so repeated construction
+    does not repeat the TCP and authentication handshake. The pool options
+    of the first shelter for a given connection are the ones in effect.
     """
 
     def __init__(
@@ -72,6 +247,11 @@ class AnimalShelter:
         db: str = "aac",
         col: str = "animals",
         authSource: str = "admin",
+        maxPoolSize: int = 100,
+        minPoolSize: int = 10,
+        maxIdleTimeMS: int = 60000,
+        direct: bool = True,
+        trusted: bool = False,
     ) -> None:
         # Allow secure override from environment variables if provided
         env_user = os.getenv("AAC_DB_USER")
@@ -85,61 +265,276 @@ class AnimalShelter:
             raise ValueError("MongoDB user and password must be provided")
 
         self._client: Optional[MongoClient] = None
+        self._collection: Optional[Collection] = None
         self._db_name = db
         self._col_name = col
+        self._client_key = (host, port, user, password, authSource, direct)
 
-        try:
-            logger.info("Connecting to MongoDB at %s:%s", host, port)
-            self._client = MongoClient(
-                host=host,
-                port=port,
-                username=user,
-                password=password,
-                authSource=authSource,
-                serverSelectionTimeoutMS=5000,
+        with _CLIENT_LOCK:
+            client = _CLIENT_CACHE.get(self._client_key)
+            if client is None:
+                logger.info("Connecting to MongoDB at %s:%s", host, port)
+                client = MongoClient(
+                    host=host,
+                    port=port,
+                    username=user,
+                    password=password,
+                    authSource=authSource,
+                    directConnection=direct,
+                    heartbeatFrequencyMS=30000,
+                    serverSelectionTimeoutMS=5000,
+                    maxPoolSize=maxPoolSize,
+                    minPoolSize=minPoolSize,
+                    maxIdleTimeMS=maxIdleTimeMS,
+                    retryWrites=True,
+                )
+                _CLIENT_CACHE[self._client_key] = client
+            else:
+                logger.info("Reusing MongoDB connection to %s:%s", host, port)
+            _CLIENT_REFCOUNTS[self._client_key] = (
+                _CLIENT_REFCOUNTS.get(self._client_key, 0) + 1
             )
+            self._client = client
 
+        try:
             # Connectivity check
             self._client.admin.command("ping")
             logger.info("Successfully connected to MongoDB")
 
         except (ServerSelectionTimeoutError, PyMongoError) as exc:
             logger.error("Failed to connect to MongoDB: %s", exc)
+            self.close()
             raise
 
+        # Resolve the collection once; every CRUD call reuses this handle
+        self._collection = self._client[db][col]
+
+        # Unacknowledged (w=0) collection handle, built on first fast insert
+        self._fast_collection: Optional[Collection] = None
+
+        # RawBSONDocument collection handle, built on first read_raw()
+        self._raw_collection: Optional[Collection] = None
+
+        # Opt-in read() result cache; see query_cache()
+        self.query_cache_enabled = False
+        self._cache_generation = 0
+        self._query_cache: "OrderedDict[tuple, Tuple[Dict[str, Any], ...]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        # Per-thread query_cache() nesting depth, plus open blocks across threads
+        self._query_cache_local = threading.local()
+        self._query_cache_blocks = 0
+
+        if trusted:
+            self.create = self._make_fast_create()  # type: ignore[method-assign]
+            self.read = self._make_fast_read()  # type: ignore[method-assign]
+
+    # ------------------------------------------------------------------
+    # Trusted (unvalidated) fast paths
+    # ------------------------------------------------------------------
+    def _make_fast_create(self) -> Callable[..., bool]:
+        """Build a create() replacement with validation and logging removed.
+
+        Collection handles are captured as closure locals so each call skips
+        the attribute and property lookups of the checked version.
+        """
+        insert_one = self._collection.insert_one
+        invalidate = self._invalidate_query_cache
+        checked = self.create_checked
+
+        def create(data: Dict[str, Any], fast: bool = False) -> bool:
+            if fast:
+                return checked(data, fast=True)
+            try:
+                result = insert_one(data)
+            finally:
+                invalidate()
+            return bool(result.acknowledged and result.inserted_id)
+
+        return create
+
+    def _make_fast_read(self) -> Callable[..., List[Dict[str, Any]]]:
+        """Build a read() replacement with validation and logging removed.
+
+        Falls back to read_checked() while the query cache is enabled.
+        """
+        find = self._collection.find
+        exclude_id = self._exclude_id
+        checked = self.read_checked
+        default_proj = _PROJ_NO_ID
+        empty_query = _EMPTY_QUERY
+        shelter = self
+
+        def read(
+            query: Optional[Dict[str, Any]] = None,
+            projection: Optional[Dict[str, int]] = None,
+            limit: int = 0,
+            sort: Optional[List[Tuple[str, int]]] = None,
+            batch_size: int = _READ_BATCH_SIZE,
+            hint: Optional[Union[str, List[Tuple[str, int]]]] = None,
+        ) -> List[Dict[str, Any]]:
+            if shelter._query_cache_active():
+                return checked(query, projection, limit, sort, batch_size, hint)
+            cursor = find(
+                query or empty_query,
+                default_proj if projection is None else exclude_id(projection),
+                limit=limit,
+                sort=sort or None,
+                batch_size=batch_size,
+                hint=hint or None,
+            )
+            return list(cursor)
+
+        return read
+
+    # ------------------------------------------------------------------
+    # Query cache
+    # ------------------------------------------------------------------
+    @contextmanager
+    def query_cache(self) -> Iterator["AnimalShelter"]:
+        """Enable the read() query cache for the duration of a `with` block.
+
+        Inside the block, repeated read() calls with the same query,
+        projection, sort and limit are answered from memory after the first
+        round-trip. Any create/update/delete through this instance
+        invalidates the cache. Cached documents are shared between callers
+        and should be treated as read-only.
+
+            with shelter.query_cache():
+                dogs = shelter.read({"animal_type": "Dog"})
+                dogs_again = shelter.read({"animal_type": "Dog"})  # no RTT
+
+        Enabling is per thread, so a block in one Dash callback does not turn
+        caching on or off for other threads sharing this shelter. The cached
+        results themselves are shared and are cleared once no thread is
+        inside a block. The cache can also be left on for every thread by
+        setting `query_cache_enabled`.
+        """
+        local = self._query_cache_local
+        local.depth = getattr(local, "depth", 0) + 1
+        with self._query_cache_lock:
+            self._query_cache_blocks += 1
+        try:
+            yield self
+        finally:
+            local.depth -= 1
+            with self._query_cache_lock:
+                self._query_cache_blocks -= 1
+                if not self._query_cache_blocks and not self.query_cache_enabled:
+                    self._query_cache.clear()
+
+    def _query_cache_active(self) -> bool:
+        """Return True if read() should use the query cache in this thread."""
+        return self.query_cache_enabled or getattr(self._query_cache_local, "depth", 0) > 0
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop every cached read() result after a write."""
+        with self._query_cache_lock:
+            self._cache_generation += 1
+            self._query_cache.clear()
+
+    @staticmethod
+    def _query_cache_key(
+        query: Optional[Dict[str, Any]],
+        projection: Optional[Dict[str, int]],
+        limit: int,
+        sort: Optional[List[Tuple[str, int]]],
+        hint: Optional[Union[str, List[Tuple[str, int]]]],
+    ) -> Optional[tuple]:
+        """Return a hashable cache key for a read, or None if there is none.
+
+        The query is serialized without sorting keys: MongoDB matches
+        embedded documents by field order, so reordered queries differ.
+        """
+        projection = AnimalShelter._normalize_projection(projection)
+        try:
+            key = (
+                json_util.dumps(query or {}),
+                frozenset(projection.items()) if projection is not None else None,
+                limit,
+                tuple(sort) if sort else None,
+                tuple(hint) if isinstance(hint, list) else hint or None,
+            )
+            hash(key)
+        except TypeError:
+            return None  # Unhashable query shape; read uncached
+        return key
+
     # ------------------------------------------------------------------
     # Internal helpers
     # ------------------------------------------------------------------
     @property
     def collection(self) -> Collection:
         """Return the underlying MongoDB collection object."""
-        if self._client is None:
+        if self._client is None or self._collection is None:
             raise RuntimeError("MongoDB client is not initialized")
-        db = self._client[self._db_name]
-        return db[self._col_name]
+        return self._collection
+
+    @property
+    def fast_collection(self) -> Collection:
+        """Return a handle to the collection with write concern w=0.
+
+        Writes through this handle are fire-and-forget: the client does not
+        wait for the server to acknowledge them. See create(fast=True).
+        """
+        if self._fast_collection is None:
+            self._fast_collection = self.collection.with_options(
+                write_concern=WriteConcern(w=0)
+            )
+        return self._fast_collection
 
     @staticmethod
-    def _clean_results(docs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Return a copy of documents with internal MongoDB fields removed.
+    def _normalize_projection(projection: Any) -> Optional[Dict[str, Any]]:
+        """Return `projection` as a dict, accepting every form pymongo does.
+
+        Any mapping (e.g. a MappingProxyType) is copied into a dict. Any
+        other iterable of field names, e.g. ["name", "breed"], becomes the
+        equivalent inclusion projection {"name": 1, "breed": 1}.
+        """
+        if projection is None or isinstance(projection, dict):
+            return projection
+        if isinstance(projection, Mapping):
+            return dict(projection)
+        if not isinstance(projection, (str, bytes)):
+            try:
+                fields = list(projection)
+            except TypeError:
+                fields = None
+            if fields is not None and all(isinstance(f, str) for f in fields):
+                return dict.fromkeys(fields, 1)
+        raise ValueError(
+            "projection must be a mapping, an iterable of field names, or None"
+        )
+
+    @classmethod
+    def _exclude_id(cls, projection: Any) -> Dict[str, Any]:
+        """Return a projection that makes the server omit the '_id' field.
 
-        Currently:
-        - Removes the '_id' field, which is an implementation detail.
+        The '_id' field is an implementation detail, so it is excluded unless
+        the caller mentions '_id' in their own projection explicitly.
         """
-        cleaned: List[Dict[str, Any]] = []
-        for doc in docs:
-            d = dict(doc)
-            d.pop("_id", None)
-            cleaned.append(d)
-        return cleaned
+        projection = cls._normalize_projection(projection)
+        if projection is None:
+            return _PROJ_NO_ID
+        if "_id" in projection:
+            return projection
+        return {**projection, "_id": 0}
 
     # ------------------------------------------------------------------
     # CRUD operations
     # ------------------------------------------------------------------
-    def create(self, data: Dict[str, Any]) -> bool:
+    def create(self, data: Dict[str, Any], fast: bool = False) -> bool:
         """Insert a single document.
 
         Returns True if the insert is acknowledged and an _id was created.
 
+        With `fast=True` the insert uses an unacknowledged write concern
+        (w=0): the client sends the document and returns without waiting for
+        the server's reply, saving a full round-trip per insert. The cost is
+        durability: a rejected or lost write (e.g. duplicate key, validation
+        failure, network drop) is never reported. Only use it for
+        non-critical, append-only data. In that mode True means the document
+        was sent, not that it was stored.
+
         Raises
         ------
         ValueError
@@ -151,24 +546,203 @@ class AnimalShelter:
             raise ValueError("create() expects a non-empty dict")
 
         try:
-            result = self.collection.insert_one(data)
-            success = bool(result.acknowledged and result.inserted_id)
-            logger.info(
-                "Inserted document with _id=%s (success=%s)",
-                result.inserted_id,
-                success,
-            )
+            try:
+                if fast:
+                    result = self.fast_collection.insert_one(data)
+                    # No acknowledgement with w=0; the _id is assigned client-side
+                    success = result.inserted_id is not None
+                else:
+                    result = self.collection.insert_one(data)
+                    success = bool(result.acknowledged and result.inserted_id)
+            finally:
+                self._invalidate_query_cache()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Inserted document with _id=%s (success=%s)",
+                    result.inserted_id,
+                    success,
+                )
             return success
         except PyMongoError as exc:
             logger.error("Error inserting document: %s", exc)
             raise
 
+    # Validating create(), still reachable when trusted=True replaces create
+    create_checked = create
+
+    def create_many(
+        self,
+        docs: Sequence[Dict[str, Any]],
+        ordered: bool = False,
+        fast: bool = False,
+    ) -> Tuple[int, List[Dict[str, Any]]]:
+        """Insert many documents using batched insert_many() calls.
+
+        Documents are sent in slices of up to 1000, so N records cost
+        roughly N / 1000 round-trips instead of N. Per-document failures
+        such as duplicate keys do not raise; they are collected and returned
+        so ingestion jobs can report or retry just the failed documents.
+
+        Parameters
+        ----------
+        docs : sequence of dict
+            Documents to insert. Each must be a non-empty dict.
+        ordered : bool, optional
+            If False (default), the server keeps inserting past a failed
+            document instead of stopping at the first error. If True,
+            inserting stops at the first failed document.
+        fast : bool, optional
+            If True, use an unacknowledged write concern (w=0), with the same
+            durability tradeoff as create(fast=True). The returned count is
+            the number of documents sent, not confirmed, and no write errors
+            are reported.
+
+        Returns
+        -------
+        (int, list of dict)
+            The number of documents inserted (or sent, when `fast` is True),
+            and the server's write errors. Each error's 'index' is the
+            position of the failed document in `docs`.
+
+        Raises
+        ------
+        ValueError
+            If `docs` is empty or contains anything but non-empty dicts.
+        PyMongoError
+            If the insert fails as a whole (e.g. connection loss).
+        BulkWriteError
+            If the server reports write concern errors (e.g. a w="majority"
+            timeout), since the durability of the batch is then unknown.
+            Chunks before the failing one have already been inserted.
+        """
+        if not docs or not all(isinstance(d, dict) and d for d in docs):
+            raise ValueError("create_many() expects a non-empty list of non-empty dicts")
+
+        collection = self.fast_collection if fast else self.collection
+        inserted = 0
+        write_errors: List[Dict[str, Any]] = []
+        try:
+            try:
+                for start in range(0, len(docs), _BULK_CHUNK_SIZE):
+                    chunk = list(docs[start:start + _BULK_CHUNK_SIZE])
+                    try:
+                        result = collection.insert_many(
+                            chunk, ordered=ordered, bypass_document_validation=False
+                        )
+                    except BulkWriteError as exc:
+                        if exc.details.get("writeConcernErrors"):
+                            raise
+                        inserted += int(exc.details.get("nInserted", 0))
+                        for error in exc.details.get("writeErrors", []):
+                            write_errors.append({**error, "index": error["index"] + start})
+                        if ordered:
+                            break
+                        continue
+                    inserted += len(chunk) if fast else len(result.inserted_ids)
+            finally:
+                self._invalidate_query_cache()
+
+            if write_errors:
+                logger.warning(
+                    "Bulk insert skipped %d document(s) with write errors",
+                    len(write_errors),
+                )
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Inserted %d document(s) in bulk", inserted)
+            return inserted, write_errors
+        except PyMongoError as exc:
+            logger.error("Error inserting documents in bulk: %s", exc)
+            raise
+
+    def bulk_write(self, ops: Sequence[Any], ordered: bool = False) -> BulkWriteResult:
+        """Execute a batch of write operations in a single round-trip.
+
+        `ops` is a sequence of pymongo request objects such as InsertOne,
+        UpdateOne, UpdateMany, ReplaceOne, DeleteOne and DeleteMany.
+
+        Returns the pymongo BulkWriteResult.
+        """
+        if not ops:
+            raise ValueError("bulk_write() expects a non-empty list of operations")
+
+        try:
+            try:
+                result = self.collection.bulk_write(list(ops), ordered=ordered)
+            finally:
+                self._invalidate_query_cache()
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Bulk write: inserted=%d matched=%d modified=%d deleted=%d upserted=%d",
+                    result.inserted_count,
+                    result.matched_count,
+                    result.modified_count,
+                    result.deleted_count,
+                    result.upserted_count,
+                )
+            return result
+        except PyMongoError as exc:
+            logger.error("Error executing bulk write: %s", exc)
+            raise
+
+    def iter_read(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        limit: int = 0,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        batch_size: int = _READ_BATCH_SIZE,
+        hint: Optional[Union[str, List[Tuple[str, int]]]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """Stream documents matching a query.
+
+        Takes the same arguments as read() and yields
+        documents as the driver receives them. Callers that only iterate
+        (exports, dashboards) can process one batch while the driver fetches
+        the next, without holding the whole result set in memory.
+
+        Raises
+        ------
+        ValueError
+            If `query` is not a dict or None. Raised immediately, before
+            iteration starts.
+        PyMongoError
+            If the underlying query fails while iterating.
+        """
+        if query is None:
+            query = _EMPTY_QUERY
+
+        if not isinstance(query, dict):
+            raise ValueError("read() expects query to be a dict or None")
+
+        cursor = self.collection.find(query, self._exclude_id(projection))
+        if sort:
+            cursor = cursor.sort(sort)
+        if isinstance(limit, int) and limit > 0:
+            cursor = cursor.limit(limit)
+        if isinstance(batch_size, int) and batch_size > 0:
+            cursor = cursor.batch_size(batch_size)
+        if hint:
+            cursor = cursor.hint(hint)
+
+        return self._stream(cursor)
+
+    @staticmethod
+    def _stream(cursor: Cursor) -> Iterator[Dict[str, Any]]:
+        """Yield documents from `cursor`, logging driver errors."""
+        try:
+            yield from cursor
+        except PyMongoError as exc:
+            logger.error("Error reading documents: %s", exc)
+            raise
+
     def read(
         self,
         query: Optional[Dict[str, Any]] = None,
         projection: Optional[Dict[str, int]] = None,
         limit: int = 0,
         sort: Optional[List[Tuple[str, int]]] = None,
+        batch_size: int = _READ_BATCH_SIZE,
+        hint: Optional[Union[str, List[Tuple[str, int]]]] = None,
     ) -> List[Dict[str, Any]]:
         """Read documents matching a query.
 
@@ -177,38 +751,170 @@ class AnimalShelter:
         query : dict, optional
             A MongoDB query document. If None or empty, all documents are returned.
         projection : dict, optional
-            Optional projection document to limit returned fields.
+            Optional projection document to limit returned fields. '_id' is
+            excluded on the server unless the projection names it explicitly.
         limit : int, optional
             Maximum number of documents to return. 0 means no explicit limit.
         sort : list of (str, int), optional
             Optional list of (field, direction) pairs for sorting.
+        batch_size : int, optional
+            Number of documents the server returns per cursor batch.
+        hint : str or list of (str, int), optional
+            Index name or key pattern the server must use, skipping query
+            plan selection, e.g. "rescue_filter" for a query on
+            animal_type and breed. See SUGGESTED_INDEXES.
+            The index must exist or the query fails.
 
         Returns
         -------
         list of dict
-            A list of matching documents with MongoDB-internal fields removed.
+            A list of matching documents without the MongoDB '_id' field.
+            Use iter_read() to stream large result sets instead.
+        """
+        key = None
+        if self._query_cache_active() and isinstance(query, (dict, type(None))):
+            key = self._query_cache_key(query, projection, limit, sort, hint)
+        if key is not None:
+            with self._query_cache_lock:
+                cached = self._query_cache.get(key)
+                if cached is not None:
+                    self._query_cache.move_to_end(key)
+                generation = self._cache_generation
+            if cached is not None:
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info("Read %d document(s) from query cache", len(cached))
+                return list(cached)
+
+            docs = tuple(self.iter_read(query, projection, limit, sort, batch_size, hint))
+            with self._query_cache_lock:
+                # Skip storing if a write happened while this read ran
+                if generation == self._cache_generation:
+                    self._query_cache[key] = docs
+                    if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read %d document(s) from collection", len(docs))
+            return list(docs)
+
+        results = list(
+            self.iter_read(query, projection, limit, sort, batch_size, hint)
+        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Read %d document(s) from collection", len(results))
+        return results
+
+    # Validating read(), still reachable when trusted=True replaces read
+    read_checked = read
+
+    def read_raw(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        limit: int = 0,
+        sort: Optional[List[Tuple[str, int]]] = None,
+        batch_size: int = _READ_BATCH_SIZE,
+        hint: Optional[Union[str, List[Tuple[str, int]]]] = None,
+    ) -> List[bytes]:
+        """Read matching documents as undecoded BSON bytes.
+
+        Takes the same arguments as read(), but skips decoding each document
+        into Python objects; the query cache is not used. Each item is one
+        complete BSON document, so the bytes can be shipped as-is to a
+        BSON-aware consumer, or concatenated and decoded later with
+        `bson.decode_all(b"".join(docs))`. Use read() when dicts (or JSON)
+        are actually needed.
         """
         if query is None:
-            query = {}
+            query = _EMPTY_QUERY
 
         if not isinstance(query, dict):
-            raise ValueError("read() expects query to be a dict or None")
+            raise ValueError("read_raw() expects query to be a dict or None")
+
+        if self._raw_collection is None:
+            self._raw_collection = self.collection.with_options(
+                codec_options=CodecOptions(document_class=RawBSONDocument)
+            )
 
         try:
-            cursor = self.collection.find(query, projection)
+            cursor = self._raw_collection.find(query, self._exclude_id(projection))
             if sort:
                 cursor = cursor.sort(sort)
             if isinstance(limit, int) and limit > 0:
                 cursor = cursor.limit(limit)
+            if isinstance(batch_size, int) and batch_size > 0:
+                cursor = cursor.batch_size(batch_size)
+            if hint:
+                cursor = cursor.hint(hint)
 
-            raw_results = list(cursor)
-            results = self._clean_results(raw_results)
-            logger.info("Read %d document(s) from collection", len(results))
+            results = [doc.raw for doc in cursor]
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read %d raw document(s) from collection", len(results))
             return results
         except PyMongoError as exc:
             logger.error("Error reading documents: %s", exc)
             raise
 
+    def read_columns(
+        self,
+        query: Optional[Dict[str, Any]],
+        columns: List[str],
+        batch_size: int = _READ_BATCH_SIZE,
+    ) -> Dict[str, List[Any]]:
+        """Read selected fields as one list per field (column-oriented).
+
+        Only `columns` are fetched. Dotted names such as "outcome.type" are
+        resolved through embedded documents, and '_id' is returned only if it
+        is one of the columns. Missing fields are filled with None so every
+        list has one entry per matching document, in the same order. Repeated
+        column names are returned once.
+        The result can be passed straight to `pandas.DataFrame(...)` or
+        `numpy.asarray(result["age_upon_outcome_in_weeks"])` without
+        transposing a list of dicts first.
+        """
+        if query is None:
+            query = _EMPTY_QUERY
+        if not isinstance(query, dict):
+            raise ValueError("read_columns() expects query to be a dict or None")
+        if not columns or not all(isinstance(c, str) and c for c in columns):
+            raise ValueError("read_columns() expects a non-empty list of field names")
+
+        # Repeated names would append to the same list twice per document
+        columns = list(dict.fromkeys(columns))
+        projection = {c: 1 for c in columns}
+        if "_id" not in projection:
+            projection["_id"] = 0
+        out: Dict[str, List[Any]] = {c: [] for c in columns}
+        appends = [(c, tuple(c.split(".")), out[c].append) for c in columns]
+
+        try:
+            cursor = self.collection.find(query, projection)
+            if isinstance(batch_size, int) and batch_size > 0:
+                cursor = cursor.batch_size(batch_size)
+            for doc in cursor:
+                get = doc.get
+                for c, path, append in appends:
+                    append(get(c) if len(path) == 1 else self._get_path(doc, path))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Read %d column(s) for %d document(s)",
+                    len(columns),
+                    len(out[columns[0]]),
+                )
+            return out
+        except PyMongoError as exc:
+            logger.error("Error reading columns: %s", exc)
+            raise
+
+    @staticmethod
+    def _get_path(doc: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+        """Return the value at a dotted `path` in `doc`, or None if missing."""
+        value: Any = doc
+        for part in path:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(part)
+        return value
+
     def update(
         self,
         query: Dict[str, Any],
@@ -233,13 +939,17 @@ class AnimalShelter:
             raise ValueError("update() expects a non-empty update_doc dict")
 
         try:
-            if many:
-                result = self.collection.update_many(query, update_doc, upsert=upsert)
-            else:
-                result = self.collection.update_one(query, update_doc, upsert=upsert)
+            try:
+                if many:
+                    result = self.collection.update_many(query, update_doc, upsert=upsert)
+                else:
+                    result = self.collection.update_one(query, update_doc, upsert=upsert)
+            finally:
+                self._invalidate_query_cache()
 
             modified_count = int(result.modified_count or 0)
-            logger.info("Updated %d document(s)", modified_count)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updated %d document(s)", modified_count)
             return modified_count
         except PyMongoError as exc:
             logger.error("Error updating document(s): %s", exc)
@@ -260,14 +970,505 @@ class AnimalShelter:
         if not isinstance(query, dict) or not query:
             raise ValueError("delete() expects a non-empty query dict")
 
+        try:
+            try:
+                if many:
+                    result = self.collection.delete_many(query)
+                else:
+                    result = self.collection.delete_one(query)
+            finally:
+                self._invalidate_query_cache()
+
+            deleted_count = int(result.deleted_count or 0)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Deleted %d document(s)", deleted_count)
+            return deleted_count
+        except PyMongoError as exc:
+            logger.error("Error deleting document(s): %s", exc)
+            raise
+
+    # ------------------------------------------------------------------
+    # Query helpers
+    # ------------------------------------------------------------------
+    def read_page(
+        self,
+        query: Optional[Dict[str, Any]],
+        sort: List[Tuple[str, int]],
+        page: int,
+        page_size: int,
+        projection: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return one page of sorted results, paginated on the server.
+
+        Sorting, skipping and limiting all happen in MongoDB, so only
+        `page_size` documents cross the wire. `page` is zero-based. A stable
+        `sort` (ending in a unique field) keeps pages from overlapping.
+
+        Skip cost grows with the page number; for deep pagination over an
+        indexed field, prefer read_after().
+        """
+        if query is None:
+            query = _EMPTY_QUERY
+        if not isinstance(query, dict):
+            raise ValueError("read_page() expects query to be a dict or None")
+        if not sort:
+            raise ValueError("read_page() requires a sort specification")
+        if not isinstance(page, int) or page < 0:
+            raise ValueError("read_page() expects a non-negative page number")
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise ValueError("read_page() expects a positive page_size")
+
+        try:
+            cursor = (
+                self.collection.find(query, self._exclude_id(projection))
+                .sort(sort)
+                .skip(page * page_size)
+                .limit(page_size)
+            )
+            results = list(cursor)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read page %d (%d document(s))", page, len(results))
+            return results
+        except PyMongoError as exc:
+            logger.error("Error reading page: %s", exc)
+            raise
+
+    def read_after(
+        self,
+        query: Optional[Dict[str, Any]],
+        sort_field: str,
+        last_value: Any,
+        page_size: int,
+        projection: Optional[Dict[str, int]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Return the next page after `last_value` using keyset pagination.
+
+        Results are sorted ascending on `sort_field` and restricted to
+        `sort_field > last_value`, so with an index on `sort_field` each page
+        is a single index range scan no matter how deep it is. Pass
+        `last_value=None` for the first page, then the `sort_field` value of
+        the last document returned. `sort_field` should be unique (or the
+        caller must tolerate skipped ties).
+        """
+        if query is None:
+            query = _EMPTY_QUERY
+        if not isinstance(query, dict):
+            raise ValueError("read_after() expects query to be a dict or None")
+        if not sort_field:
+            raise ValueError("read_after() requires a sort_field")
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise ValueError("read_after() expects a positive page_size")
+
+        if last_value is not None:
+            after = {sort_field: {"$gt": last_value}}
+            query = {"$and": [query, after]} if query else after
+
+        # sort_field must be returned for the caller to fetch the next page,
+        # even when it is '_id'
+        projection = self._normalize_projection(projection)
+        if projection is not None and any(projection.values()):
+            projection = {**projection, sort_field: 1}
+        elif projection is not None:
+            projection = {k: v for k, v in projection.items() if k != sort_field}
+        if sort_field == "_id":
+            find_projection = projection or None
+        else:
+            find_projection = self._exclude_id(projection)
+
+        try:
+            cursor = (
+                self.collection.find(query, find_projection)
+                .sort([(sort_field, 1)])
+                .limit(page_size)
+            )
+            results = list(cursor)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read %d document(s) after %r", len(results), last_value)
+            return results
+        except PyMongoError as exc:
+            logger.error("Error reading page: %s", exc)
+            raise
+
+    def count(self, query: Optional[Dict[str, Any]] = None) -> int:
+        """Return the number of documents matching `query`.
+
+        Counting happens on the server, so no documents are transferred.
+        With no query, the collection metadata count is used, which avoids
+        scanning the collection entirely.
+
+        Raises
+        ------
+        ValueError
+            If `query` is not a dict or None.
+        PyMongoError
+            If the underlying count fails.
+        """
+        if query is not None and not isinstance(query, dict):
+            raise ValueError("count() expects query to be a dict or None")
+
+        try:
+            if not query:
+                total = int(self.collection.estimated_document_count())
+            else:
+                total = int(self.collection.count_documents(query))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Counted %d document(s)", total)
+            return total
+        except PyMongoError as exc:
+            logger.error("Error counting documents: %s", exc)
+            raise
+
+    def aggregate(self, pipeline: List[Dict[str, Any]], **kwargs: Any) -> List[Dict[str, Any]]:
+        """Run an aggregation pipeline and return its results.
+
+        Filtering, projection and grouping run on the server in one
+        round-trip, so only the (usually small) output is transferred.
+        Extra keyword arguments, e.g. `allowDiskUse=True`, are passed to
+        pymongo's aggregate().
+        """
+        if not isinstance(pipeline, list) or not pipeline:
+            raise ValueError("aggregate() expects a non-empty pipeline list")
+
+        try:
+            results = list(self.collection.aggregate(pipeline, **kwargs))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Aggregation returned %d document(s)", len(results))
+            return results
+        except PyMongoError as exc:
+            logger.error("Error running aggregation: %s", exc)
+            raise
+
+    def group_counts(
+        self,
+        field: str,
+        query: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[Any, int]]:
+        """Count matching documents per distinct value of `field`.
+
+        Equivalent to reading every match and calling value_counts(), but
+        computed server-side. Returns (value, count) pairs ordered from most
+        to least frequent. Values may be lists or embedded documents if the
+        field holds them; for scalar fields, `dict(...)` gives a lookup.
+
+            dict(shelter.group_counts("breed", {"animal_type": "Dog"}))
+        """
+        if not field:
+            raise ValueError("group_counts() requires a field name")
+        if query is not None and not isinstance(query, dict):
+            raise ValueError("group_counts() expects query to be a dict or None")
+
+        pipeline: List[Dict[str, Any]] = []
+        if query:
+            pipeline.append({"$match": query})
+        pipeline += [
+            # Drop every other field before grouping
+            {"$project": {"_id": 0, field: 1}},
+            {"$group": {"_id": f"${field}", "n": {"$sum": 1}}},
+            {"$sort": {"n": -1}},
+        ]
+        return [(row["_id"], row["n"]) for row in self.aggregate(pipeline)]
+
+    def ensure_indexes(
+        self,
+        specs: Optional[List[Tuple[List[Tuple[str, int]], Dict[str, Any]]]] = None,
+    ) -> List[str]:
+        """Create indexes for common query shapes.
+
+        Each spec is a `(keys, options)` pair passed to create_index(), e.g.
+        `([("outcome_type", 1), ("datetime", 1)], {"name": "outcome_date"})`.
+        Defaults to SUGGESTED_INDEXES. Creating an index that already exists
+        with the same keys and options is a no-op, so this is safe to call
+        on every startup.
+
+        Returns the names of the indexes.
+        """
+        if specs is None:
+            specs = SUGGESTED_INDEXES
+
+        names: List[str] = []
+        try:
+            for keys, options in specs:
+                names.append(self.collection.create_index(keys, **options))
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Ensured %d index(es): %s", len(names), ", ".join(names))
+            return names
+        except PyMongoError as exc:
+            logger.error("Error creating indexes: %s", exc)
+            raise
+
+    # ------------------------------------------------------------------
+    # Pre-aggregated rollups
+    # ------------------------------------------------------------------
+    def refresh_rollup(self, pipeline: List[Dict[str, Any]], target: str) -> None:
+        """Recompute a rollup collection from the base collection.
+
+        Runs `pipeline` on the server and merges its output into the
+        collection `target` in the same database, replacing documents with
+        a matching `_id`. Dashboards can then read the small rollup with
+        read_rollup() instead of re-aggregating the base collection on every
+        request. Call this periodically (e.g. on a timer or after imports).
+
+        Rollup groups that no longer appear in the output are not removed.
+        Requires MongoDB 4.2+ for `$merge`.
+
+            shelter.refresh_rollup(OUTCOME_BY_MONTH_PIPELINE, "outcome_by_month")
+        """
+        if not isinstance(pipeline, list) or not pipeline:
+            raise ValueError("refresh_rollup() expects a non-empty pipeline list")
+        if not target or target == self._col_name:
+            raise ValueError("refresh_rollup() expects a separate target collection")
+
+        merge = {"$merge": {"into": target, "whenMatched": "replace"}}
+        try:
+            # $merge writes server-side and returns no documents
+            self.collection.aggregate(pipeline + [merge], allowDiskUse=True)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Refreshed rollup collection '%s'", target)
+        except PyMongoError as exc:
+            logger.error("Error refreshing rollup '%s': %s", target, exc)
+            raise
+
+    def read_rollup(
+        self,
+        name: str,
+        query: Optional[Dict[str, Any]] = None,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read documents from the rollup collection `name`.
+
+            shelter.read_rollup("outcome_by_month", {"outcome_type": "Adoption"},
+                                sort=[("month", 1)])
+        """
+        if not name:
+            raise ValueError("read_rollup() requires a rollup collection name")
+        if query is None:
+            query = _EMPTY_QUERY
+        if not isinstance(query, dict):
+            raise ValueError("read_rollup() expects query to be a dict or None")
+        if self._client is None:
+            raise RuntimeError("MongoDB client is not initialized")
+
+        try:
+            cursor = self._client[self._db_name][name].find(query, _PROJ_NO_ID)
+            if sort:
+                cursor = cursor.sort(sort)
+            results = list(cursor)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read %d document(s) from rollup '%s'", len(results), name)
+            return results
+        except PyMongoError as exc:
+            logger.error("Error reading rollup '%s': %s", name, exc)
+            raise
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Release this shelter's MongoDB client.
+
+        The shared client is only closed once the last shelter using it has
+        been closed.
+        """
+        if self._client is None:
+            return
+
+        with _CLIENT_LOCK:
+            remaining = _CLIENT_REFCOUNTS.get(self._client_key, 1) - 1
+            if remaining > 0:
+                _CLIENT_REFCOUNTS[self._client_key] = remaining
+            else:
+                _CLIENT_REFCOUNTS.pop(self._client_key, None)
+                _CLIENT_CACHE.pop(self._client_key, None)
+                logger.info("Closing MongoDB client connection")
+                self._client.close()
+        self._client = None
+        self._collection = None
+        self._fast_collection = None
+        self._raw_collection = None
+
+        # Drop trusted fast paths so create()/read() fall back to the checked
+        # methods, which raise RuntimeError once the client is released
+        self.__dict__.pop("create", None)
+        self.__dict__.pop("read", None)
+
+    def __repr__(self) -> str:
+        return f"<AnimalShelter db='{self._db_name}' col='{self._col_name}'>"
+
+
+class AsyncAnimalShelter:
+    """Asyncio counterpart of AnimalShelter, backed by Motor.
+
+    Every CRUD method is a coroutine, so many requests can share a single
+    event loop instead of blocking one thread per MongoDB round-trip.
+    Independent operations can be batched with ``asyncio.gather(...)``.
+
+    Instances must be created with the ``connect()`` classmethod, which
+    awaits the connectivity check before returning:
+
+        shelter = await AsyncAnimalShelter.connect(user, password)
+        dogs, cats = await asyncio.gather(
+            shelter.read({"animal_type": "Dog"}),
+            shelter.read({"animal_type": "Cat"}),
+        )
+
+    Parameters user through authSource, and `direct`, match AnimalShelter.
+    """
+
+    def __init__(
+        self,
+        user: str,
+        password: str,
+        host: str = "localhost",
+        port: int = 27017,
+        db: str = "aac",
+        col: str = "animals",
+        authSource: str = "admin",
+        direct: bool = True,
+    ) -> None:
+        if AsyncIOMotorClient is None:
+            raise ImportError("AsyncAnimalShelter requires the 'motor' package")
+
+        env_user = os.getenv("AAC_DB_USER")
+        env_pass = os.getenv("AAC_DB_PASS")
+        if env_user:
+            user = env_user
+        if env_pass:
+            password = env_pass
+
+        if not user or not password:
+            raise ValueError("MongoDB user and password must be provided")
+
+        self._db_name = db
+        self._col_name = col
+        self._host = host
+        self._port = port
+        self._client: Optional[AsyncIOMotorClient] = AsyncIOMotorClient(
+            host=host,
+            port=port,
+            username=user,
+            password=password,
+            authSource=authSource,
+            directConnection=direct,
+            heartbeatFrequencyMS=30000,
+            serverSelectionTimeoutMS=5000,
+        )
+
+    @classmethod
+    async def connect(cls, *args: Any, **kwargs: Any) -> "AsyncAnimalShelter":
+        """Create an instance and await a ping before returning it."""
+        shelter = cls(*args, **kwargs)
+        try:
+            logger.info("Connecting to MongoDB at %s:%s", shelter._host, shelter._port)
+            await shelter._client.admin.command("ping")
+            logger.info("Successfully connected to MongoDB")
+        except (ServerSelectionTimeoutError, PyMongoError) as exc:
+            logger.error("Failed to connect to MongoDB: %s", exc)
+            shelter.close()
+            raise
+        return shelter
+
+    # ------------------------------------------------------------------
+    # Internal helpers
+    # ------------------------------------------------------------------
+    @property
+    def collection(self) -> Any:
+        """Return the underlying Motor collection object."""
+        if self._client is None:
+            raise RuntimeError("MongoDB client is not initialized")
+        return self._client[self._db_name][self._col_name]
+
+    # ------------------------------------------------------------------
+    # CRUD operations
+    # ------------------------------------------------------------------
+    async def create(self, data: Dict[str, Any]) -> bool:
+        """Insert a single document. See AnimalShelter.create()."""
+        if not isinstance(data, dict) or not data:
+            raise ValueError("create() expects a non-empty dict")
+
+        try:
+            result = await self.collection.insert_one(data)
+            success = bool(result.acknowledged and result.inserted_id)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Inserted document with _id=%s (success=%s)",
+                    result.inserted_id,
+                    success,
+                )
+            return success
+        except PyMongoError as exc:
+            logger.error("Error inserting document: %s", exc)
+            raise
+
+    async def read(
+        self,
+        query: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, int]] = None,
+        limit: int = 0,
+        sort: Optional[List[Tuple[str, int]]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Read documents matching a query. See AnimalShelter.read()."""
+        if query is None:
+            query = _EMPTY_QUERY
+
+        if not isinstance(query, dict):
+            raise ValueError("read() expects query to be a dict or None")
+
+        try:
+            cursor = self.collection.find(query, AnimalShelter._exclude_id(projection))
+            if sort:
+                cursor = cursor.sort(sort)
+            if isinstance(limit, int) and limit > 0:
+                cursor = cursor.limit(limit)
+
+            results = await cursor.to_list(length=limit or None)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Read %d document(s) from collection", len(results))
+            return results
+        except PyMongoError as exc:
+            logger.error("Error reading documents: %s", exc)
+            raise
+
+    async def update(
+        self,
+        query: Dict[str, Any],
+        update_doc: Dict[str, Any],
+        many: bool = False,
+        upsert: bool = False,
+    ) -> int:
+        """Update one or many documents. See AnimalShelter.update()."""
+        if not isinstance(query, dict) or not query:
+            raise ValueError("update() expects a non-empty query dict")
+        if not isinstance(update_doc, dict) or not update_doc:
+            raise ValueError("update() expects a non-empty update_doc dict")
+
         try:
             if many:
-                result = self.collection.delete_many(query)
+                result = await self.collection.update_many(query, update_doc, upsert=upsert)
             else:
-                result = self.collection.delete_one(query)
+                result = await self.collection.update_one(query, update_doc, upsert=upsert)
+
+            modified_count = int(result.modified_count or 0)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Updated %d document(s)", modified_count)
+            return modified_count
+        except PyMongoError as exc:
+            logger.error("Error updating document(s): %s", exc)
+            raise
+
+    async def delete(self, query: Dict[str, Any], many: bool = False) -> int:
+        """Delete one or many documents. See AnimalShelter.delete()."""
+        if not isinstance(query, dict) or not query:
+            raise ValueError("delete() expects a non-empty query dict")
+
+        try:
+            if many:
+                result = await self.collection.delete_many(query)
+            else:
+                result = await self.collection.delete_one(query)
 
             deleted_count = int(result.deleted_count or 0)
-            logger.info("Deleted %d document(s)", deleted_count)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("Deleted %d document(s)", deleted_count)
             return deleted_count
         except PyMongoError as exc:
             logger.error("Error deleting document(s): %s", exc)
@@ -277,11 +1478,11 @@ class AnimalShelter:
     # Lifecycle
     # ------------------------------------------------------------------
     def close(self) -> None:
-        """Close the underlying MongoDB client connection, if open."""
+        """Close the underlying Motor client, if open."""
         if self._client is not None:
             logger.info("Closing MongoDB client connection")
             self._client.close()
             self._client = None
 
     def __repr__(self) -> str:
-        return f"<AnimalShelter db='{self._db_name}' col='{self._col_name}'>"
+        return f"<AsyncAnimalShelter db='{self._db_name}' col='{self._col_name}'>"